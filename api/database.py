@@ -1,7 +1,6 @@
 from typing import Annotated, Generator
-import pandas as pd
-from datetime import datetime
-from sqlmodel import create_engine, SQLModel, Session
+from sqlalchemy import event
+from sqlmodel import create_engine, select, SQLModel, Session, text
 from fastapi import Depends
 
 from models import MESData
@@ -12,6 +11,23 @@ sqlite_url = f"sqlite:///{sqlite_file_name}"
 engine = create_engine(sqlite_url, connect_args={"check_same_thread": False})
 
 
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune SQLite for the read-heavy /query workload.
+
+    WAL lets readers proceed while the importer writes, synchronous=NORMAL
+    drops the per-transaction fsync without risking corruption, and the
+    mmap/cache settings keep repeat reads in memory-mapped pages.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
@@ -24,40 +40,70 @@ def get_session() -> Generator[Session, None, None]:
 SessionDep = Annotated[Session, Depends(get_session)]
 
 
+# Low-cardinality string columns in the source CSV. Reading them as pandas
+# categories means each distinct value ("LINE1-FIL", "Running", ...) exists
+# once in memory and is shared across all 36k rows during the import.
+CSV_CATEGORY_COLUMNS = {
+    'ProductionOrderID': 'category',
+    'LineID': 'category',
+    'EquipmentID': 'category',
+    'EquipmentType': 'category',
+    'ProductID': 'category',
+    'ProductName': 'category',
+    'MachineStatus': 'category',
+    'DowntimeReason': 'category',
+}
+
+
 def import_csv_data():
     """Import data from CSV file into the database"""
-    df = pd.read_csv("../data/mes_data_with_kpis.csv")
-    
     with Session(engine) as session:
-        # Check if data already exists
-        existing = session.query(MESData).first()
+        # Check if data already exists before paying for the CSV parse;
+        # probing a single id is enough to know
+        existing = session.exec(select(MESData.id).limit(1)).first()
         if existing:
             print("Data already imported, skipping...")
             return
-        
-        # Convert DataFrame to MESData objects
-        for _, row in df.iterrows():
-            mes_data = MESData(
-                timestamp=datetime.strptime(row['Timestamp'], '%Y-%m-%d %H:%M:%S'),
-                production_order_id=row['ProductionOrderID'] if pd.notna(row['ProductionOrderID']) else None,
-                line_id=str(row['LineID']),
-                equipment_id=row['EquipmentID'],
-                equipment_type=row['EquipmentType'],
-                product_id=row['ProductID'] if pd.notna(row['ProductID']) else None,
-                product_name=row['ProductName'] if pd.notna(row['ProductName']) else None,
-                machine_status=row['MachineStatus'],
-                downtime_reason=row['DowntimeReason'] if pd.notna(row['DowntimeReason']) else None,
-                good_units_produced=int(row['GoodUnitsProduced']),
-                scrap_units_produced=int(row['ScrapUnitsProduced']),
-                target_rate_units_per_5min=int(row['TargetRate_units_per_5min']),
-                standard_cost_per_unit=float(row['StandardCost_per_unit']),
-                sale_price_per_unit=float(row['SalePrice_per_unit']),
-                availability_score=float(row['Availability_Score']),
-                performance_score=float(row['Performance_Score']),
-                quality_score=float(row['Quality_Score']),
-                oee_score=float(row['OEE_Score'])
-            )
-            session.add(mes_data)
-        
+
+        # Imported lazily so warm starts (data already present) never pay
+        # the pandas import
+        import pandas as pd
+
+        df = pd.read_csv("../data/mes_data_with_kpis.csv", dtype=CSV_CATEGORY_COLUMNS)
+
+        # Convert the DataFrame column-wise (vectorized) instead of row by
+        # row with iterrows
+        converted = pd.DataFrame({
+            'timestamp': pd.to_datetime(df['Timestamp'], format='%Y-%m-%d %H:%M:%S'),
+            'production_order_id': df['ProductionOrderID'],
+            'line_id': df['LineID'].astype(str),
+            'equipment_id': df['EquipmentID'],
+            'equipment_type': df['EquipmentType'],
+            'product_id': df['ProductID'],
+            'product_name': df['ProductName'],
+            'machine_status': df['MachineStatus'],
+            'downtime_reason': df['DowntimeReason'],
+            'good_units_produced': df['GoodUnitsProduced'].astype(int),
+            'scrap_units_produced': df['ScrapUnitsProduced'].astype(int),
+            'target_rate_units_per_5min': df['TargetRate_units_per_5min'].astype(int),
+            'standard_cost_per_unit': df['StandardCost_per_unit'].astype(float),
+            'sale_price_per_unit': df['SalePrice_per_unit'].astype(float),
+            'availability_score': df['Availability_Score'].astype(float),
+            'performance_score': df['Performance_Score'].astype(float),
+            'quality_score': df['Quality_Score'].astype(float),
+            'oee_score': df['OEE_Score'].astype(float),
+        })
+
+        # NaN -> None so nullable columns store SQL NULL
+        converted = converted.astype(object).where(converted.notna(), None)
+
+        # The import is rebuildable from the CSV, so skip fsyncs for the
+        # duration of the bulk load and restore durability afterwards
+        session.exec(text("PRAGMA synchronous=OFF"))
+
+        # Bulk insert in one batch/transaction instead of per-row ORM adds
+        session.bulk_insert_mappings(MESData, converted.to_dict('records'))
         session.commit()
+
+        session.exec(text("PRAGMA synchronous=NORMAL"))
         print(f"Imported {len(df)} records from CSV")
\ No newline at end of file
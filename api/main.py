@@ -1,3 +1,4 @@
+import re
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from fastapi import FastAPI, Query, HTTPException
@@ -21,6 +22,38 @@ def on_startup():
     import_csv_data()
 
 
+# Keywords that must never appear in a submitted query. Compiled once at
+# import time into a single alternation so the safety check is one pass over
+# the SQL instead of one substring scan per keyword. Word boundaries keep
+# identifiers like "created_at" or "last_update" from tripping the filter.
+DANGEROUS_KEYWORDS = ('DROP', 'DELETE', 'INSERT', 'UPDATE', 'ALTER', 'CREATE', 'EXEC', 'EXECUTE')
+DANGEROUS_KEYWORD_RE = re.compile(r'\b(' + '|'.join(DANGEROUS_KEYWORDS) + r')\b')
+
+# SQL type fragment -> simple type for /schema, first match wins (DATETIME
+# must be tried before DATE); anything unmatched falls back to string
+SIMPLE_TYPE_MAP = (
+    ("INTEGER", "integer"),
+    ("BIGINT", "integer"),
+    ("VARCHAR", "string"),
+    ("TEXT", "string"),
+    ("FLOAT", "float"),
+    ("REAL", "float"),
+    ("DOUBLE", "float"),
+    ("DATETIME", "datetime"),
+    ("TIMESTAMP", "datetime"),
+    ("DATE", "date"),
+    ("BOOLEAN", "boolean"),
+)
+
+
+def map_simple_type(type_str: str) -> str:
+    """Map a SQLAlchemy type string to the simple type used in YAML configs"""
+    for fragment, simple_type in SIMPLE_TYPE_MAP:
+        if fragment in type_str:
+            return simple_type
+    return "string"
+
+
 class SQLQuery(BaseModel):
     sql: str
     limit: Optional[int] = 1000
@@ -55,48 +88,51 @@ def execute_query(query: SQLQuery, session: SessionDep):
             detail="Only SELECT statements are allowed"
         )
     
-    # Check for dangerous keywords
-    dangerous_keywords = ['DROP', 'DELETE', 'INSERT', 'UPDATE', 'ALTER', 'CREATE', 'EXEC', 'EXECUTE']
+    # Check for dangerous keywords in a single pass
     sql_upper = sql.upper()
-    for keyword in dangerous_keywords:
-        if keyword in sql_upper:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Query contains forbidden keyword: {keyword}"
-            )
+    match = DANGEROUS_KEYWORD_RE.search(sql_upper)
+    if match:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Query contains forbidden keyword: {match.group(1)}"
+        )
     
     try:
+        # Bind once instead of re-reading the model attribute at each use
+        limit = query.limit
+
         # Apply limit if not already present and limit is specified
         limited = False
-        if query.limit and 'LIMIT' not in sql_upper:
-            sql = f"{sql} LIMIT {query.limit + 1}"  # Add 1 to detect if limit was hit
+        if limit and 'LIMIT' not in sql_upper:
+            sql = f"{sql} LIMIT {limit + 1}"  # Add 1 to detect if limit was hit
             limited = True
-        
+
         # Execute the query
         result = session.exec(text(sql))
-        
+
         # Get column names
         columns = list(result.keys()) if result.returns_rows else []
-        
+
         # Fetch all results
         rows = result.fetchall() if result.returns_rows else []
-        
+
         # Check if we hit the limit
-        if limited and len(rows) > query.limit:
-            rows = rows[:query.limit]
+        if limited and len(rows) > limit:
+            rows = rows[:limit]
             limited = True
         else:
             limited = False
         
-        # Convert rows to list of dicts
-        data = [dict(zip(columns, row)) for row in rows]
-        
-        # Convert datetime objects to strings for JSON serialization
-        for row in data:
-            for key, value in row.items():
-                if isinstance(value, datetime):
-                    row[key] = value.isoformat()
-        
+        # Convert rows to list of dicts, stringifying datetimes for JSON
+        # serialization in the same pass
+        data = [
+            {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in zip(columns, row)
+            }
+            for row in rows
+        ]
+
         return SQLResponse(
             query=query.sql,
             columns=columns,
@@ -135,22 +171,8 @@ def get_schema() -> Dict[str, Any]:
             }
             
             # Map SQLAlchemy types to simple types
-            type_str = str(column["type"])
-            if "INTEGER" in type_str or "BIGINT" in type_str:
-                col_info["simple_type"] = "integer"
-            elif "VARCHAR" in type_str or "TEXT" in type_str:
-                col_info["simple_type"] = "string"
-            elif "FLOAT" in type_str or "REAL" in type_str or "DOUBLE" in type_str:
-                col_info["simple_type"] = "float"
-            elif "DATETIME" in type_str or "TIMESTAMP" in type_str:
-                col_info["simple_type"] = "datetime"
-            elif "DATE" in type_str:
-                col_info["simple_type"] = "date"
-            elif "BOOLEAN" in type_str:
-                col_info["simple_type"] = "boolean"
-            else:
-                col_info["simple_type"] = "string"
-            
+            col_info["simple_type"] = map_simple_type(str(column["type"]))
+
             table_info["columns"].append(col_info)
         
         # Get primary key
@@ -1,11 +1,18 @@
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
 class MESData(SQLModel, table=True):
     __tablename__ = "mes_data"
-    
+    # Composite indexes for the common query shapes (per-line and
+    # per-equipment time series) so they don't fall back to full scans
+    __table_args__ = (
+        Index("idx_mes_line_ts", "line_id", "timestamp"),
+        Index("idx_mes_equipment_ts", "equipment_id", "timestamp"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     timestamp: datetime = Field(index=True)
     production_order_id: Optional[str] = Field(default=None, index=True)
@@ -11,10 +11,14 @@ def get_api_schema():
     response = requests.get("http://localhost:8000/schema")
     return response.json()
 
+# Use the LibYAML C loader when available; same safe_load semantics, much
+# faster parse
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 def load_yaml(yaml_path):
     """Load YAML file"""
     with open(yaml_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YAML_LOADER)
 
 def cross_check_schemas():
     """Cross-check API schema with YAML files"""
@@ -51,8 +55,10 @@ def cross_check_schemas():
     print("-" * 40)
     
     all_match = True
+    yaml_columns = set()
     for prop_name, prop_data in db_yaml['properties'].items():
         sql_column = prop_data['sql_column']
+        yaml_columns.add(sql_column)
         yaml_type = prop_data['type']
         required = prop_data.get('required', False)
         
@@ -86,7 +92,6 @@ def cross_check_schemas():
     print("\n🔍 Checking for API columns not in YAML:")
     print("-" * 40)
     
-    yaml_columns = {prop['sql_column'] for prop in db_yaml['properties'].values()}
     extra_api_columns = set(api_columns.keys()) - yaml_columns
     
     if extra_api_columns:
@@ -22,9 +22,16 @@ def extract_successful_queries(log_file: str = "query_logs.json") -> List[Dict]:
             entry.get('endpoint') == '/query' and
             entry.get('intent')):
             
+            # Parse the response JSON once and reuse it for both the SQL
+            # fallback and the row count
+            try:
+                response_data = json.loads(entry.get('response', '{}'))
+            except:
+                response_data = {}
+
             # Extract SQL from request body or response
             sql = ''
-            
+
             # Try to get SQL from request body first
             request_body = entry.get('request_body', '')
             if request_body and request_body != '@-':
@@ -33,23 +40,14 @@ def extract_successful_queries(log_file: str = "query_logs.json") -> List[Dict]:
                     sql = request_data.get('sql', '')
                 except:
                     pass
-            
-            # If no SQL in request, try to extract from response
+
+            # If no SQL in request, fall back to the response
             if not sql:
-                try:
-                    response_data = json.loads(entry.get('response', '{}'))
-                    sql = response_data.get('query', '')
-                except:
-                    pass
-            
+                sql = response_data.get('query', '')
+
             if sql:
-                # Extract row count from response
-                try:
-                    response_data = json.loads(entry.get('response', '{}'))
-                    row_count = response_data.get('row_count', 0)
-                except:
-                    row_count = 0
-                
+                row_count = response_data.get('row_count', 0)
+
                 successful.append({
                     'id': entry.get('id'),
                     'timestamp': entry.get('timestamp'),
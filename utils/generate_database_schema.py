@@ -24,45 +24,50 @@ def get_schema_from_api() -> Dict[str, Any]:
         print(f"Error fetching schema: {e}")
         exit(1)
 
+# Columns whose ontology property doesn't follow the generic
+# snake_case -> hasCamelCase rule; one dict lookup instead of a chain of
+# equality checks per column
+SPECIAL_PROPERTY_NAMES = {
+    "production_order_id": "hasOrderID",
+    "line_id": "hasLineID",
+    "equipment_id": "hasEquipmentID",
+    "product_id": "hasProductID",
+    "oee_score": "hasOEEScore",
+}
+
 def map_column_to_property(column_name: str) -> str:
     """Map database column name to ontology property name"""
+    special = SPECIAL_PROPERTY_NAMES.get(column_name)
+    if special:
+        return special
+
     # Convert snake_case to camelCase
     parts = column_name.split('_')
     if len(parts) > 1:
-        # Special cases
-        if column_name == "production_order_id":
-            return "hasOrderID"
-        elif column_name == "line_id":
-            return "hasLineID"
-        elif column_name == "equipment_id":
-            return "hasEquipmentID"
-        elif column_name == "product_id":
-            return "hasProductID"
-        elif column_name == "oee_score":
-            return "hasOEEScore"
-        
         # General conversion
         return 'has' + ''.join(word.capitalize() for word in parts)
     return 'has' + column_name.capitalize()
 
+# Business-friendly names for columns that don't follow the default
+# capitalization rule; built once instead of per get_business_name call
+SPECIAL_BUSINESS_NAMES = {
+    "oee_score": "OEE",
+    "good_units_produced": "Good Units",
+    "scrap_units_produced": "Scrap Units",
+    "target_rate_units_per_5min": "Target Rate (5 min)",
+    "standard_cost_per_unit": "Unit Cost",
+    "sale_price_per_unit": "Sale Price",
+    "availability_score": "Availability %",
+    "performance_score": "Performance %",
+    "quality_score": "Quality %",
+    "downtime_reason": "Downtime Code"
+}
+
 def get_business_name(column_name: str) -> str:
     """Generate business-friendly name"""
-    special_names = {
-        "oee_score": "OEE",
-        "good_units_produced": "Good Units",
-        "scrap_units_produced": "Scrap Units",
-        "target_rate_units_per_5min": "Target Rate (5 min)",
-        "standard_cost_per_unit": "Unit Cost",
-        "sale_price_per_unit": "Sale Price",
-        "availability_score": "Availability %",
-        "performance_score": "Performance %",
-        "quality_score": "Quality %",
-        "downtime_reason": "Downtime Code"
-    }
-    
-    if column_name in special_names:
-        return special_names[column_name]
-    
+    if column_name in SPECIAL_BUSINESS_NAMES:
+        return SPECIAL_BUSINESS_NAMES[column_name]
+
     # Default: capitalize and replace underscores
     return ' '.join(word.capitalize() for word in column_name.split('_'))
 
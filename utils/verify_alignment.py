@@ -12,43 +12,37 @@ def load_csv_headers(csv_path):
         headers = next(reader)
     return headers
 
+# Use the LibYAML C loader when available; same safe_load semantics, much
+# faster parse
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 def load_yaml(yaml_path):
     """Load YAML file"""
     with open(yaml_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YAML_LOADER)
+
+# Special cases for camelCase CSV columns; a single table lookup instead of
+# evaluating a chain of equality checks per column
+CSV_COLUMN_MAP = {
+    "ProductionOrderID": "production_order_id",
+    "LineID": "line_id",
+    "EquipmentID": "equipment_id",
+    "EquipmentType": "equipment_type",
+    "ProductID": "product_id",
+    "ProductName": "product_name",
+    "MachineStatus": "machine_status",
+    "DowntimeReason": "downtime_reason",
+    "GoodUnitsProduced": "good_units_produced",
+    "ScrapUnitsProduced": "scrap_units_produced",
+    "TargetRate_units_per_5min": "target_rate_units_per_5min",
+    "StandardCost_per_unit": "standard_cost_per_unit",
+    "SalePrice_per_unit": "sale_price_per_unit",
+}
 
 def csv_to_snake_case(csv_col):
     """Convert CSV column name to snake_case"""
-    # Handle special cases for camelCase columns
-    if csv_col == "ProductionOrderID":
-        return "production_order_id"
-    elif csv_col == "LineID":
-        return "line_id"
-    elif csv_col == "EquipmentID":
-        return "equipment_id"
-    elif csv_col == "EquipmentType":
-        return "equipment_type"
-    elif csv_col == "ProductID":
-        return "product_id"
-    elif csv_col == "ProductName":
-        return "product_name"
-    elif csv_col == "MachineStatus":
-        return "machine_status"
-    elif csv_col == "DowntimeReason":
-        return "downtime_reason"
-    elif csv_col == "GoodUnitsProduced":
-        return "good_units_produced"
-    elif csv_col == "ScrapUnitsProduced":
-        return "scrap_units_produced"
-    elif csv_col == "TargetRate_units_per_5min":
-        return "target_rate_units_per_5min"
-    elif csv_col == "StandardCost_per_unit":
-        return "standard_cost_per_unit"
-    elif csv_col == "SalePrice_per_unit":
-        return "sale_price_per_unit"
-    else:
-        # For already snake_case columns (like scores), just lowercase
-        return csv_col.lower()
+    # For already snake_case columns (like scores), just lowercase
+    return CSV_COLUMN_MAP.get(csv_col, csv_col.lower())
 
 def verify_alignment():
     """Verify alignment between all three files"""
@@ -65,7 +59,14 @@ def verify_alignment():
     # Extract properties from ontology and database
     onto_props = ontology['properties']
     db_props = db_schema['properties']
-    
+
+    # Flat index from sql_column back to property name, built once so each
+    # CSV column is a single dict lookup instead of a scan over all properties
+    sql_column_index = {
+        prop_data['sql_column']: prop_name
+        for prop_name, prop_data in db_props.items()
+    }
+
     # Check each CSV column
     print("\n📊 CSV to Database/Ontology Mapping:")
     print("-" * 40)
@@ -75,17 +76,10 @@ def verify_alignment():
         # Convert CSV column to snake_case (lowercase with underscores)
         snake_case = csv_to_snake_case(csv_col)
         
-        # Find in database schema - need to check all properties
-        db_col = None
-        onto_prop = None
-        
-        for prop_name, prop_data in db_props.items():
-            # Compare snake_case version of CSV column with database column
-            if prop_data['sql_column'] == snake_case:
-                db_col = prop_data['sql_column']
-                onto_prop = prop_name
-                break
-        
+        # Find in database schema via the flat index
+        onto_prop = sql_column_index.get(snake_case)
+        db_col = snake_case if onto_prop else None
+
         # Check if ontology property exists
         onto_exists = onto_prop in onto_props if onto_prop else False
         